@@ -35,7 +35,10 @@ from urllib.robotparser import RobotFileParser
 from urllib.parse import urlparse
 
 # ~ Import Third-Party Modules. ~ #
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, Error as PlaywrightError
+
+# ~ Import Local Modules. ~ #
+from governor import ResourceGovernor
 
 
 class StateManager:
@@ -44,12 +47,15 @@ class StateManager:
       visual state of the web. ~
     """
 
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, governor=None):
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
         self.headless = headless
+        self.governor = governor or ResourceGovernor()
+        self.last_stats = {}
+        self._page_crashed = False
 
         moz_agent = "Mozilla/5.0 (X11; Linux x86_64)"
         scout_repo = "https://github.com/SpudWorks-Labs/SpudScout"
@@ -63,13 +69,62 @@ class StateManager:
 
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=self.headless)
+        self._open_context()
+
+        logging.info("Browser session started!")
+
+    def _open_context(self):
+        """
+        ~ Private method to open a fresh context and page under the governor. ~
+        """
+
         self.context = self.browser.new_context(
             user_agent=self.user_agent,
             viewport={'width': 1280, 'height': 720}
         )
+        self.governor.attach(self.context)
+        self._open_page()
+
+    def _open_page(self):
+        """
+        ~ Private method to open a fresh page under the governor. ~
+        """
+
         self.page = self.context.new_page()
+        self._page_crashed = False
+        self.page.on("crash", self._on_crash)
+        self.governor.attach_page(self.page)
 
-        logging.info("Browser session started!")
+    def _on_crash(self, page):
+        """
+        ~ Private method to flag the page after its renderer crashed. ~
+        """
+
+        logging.error("The page crashed, it will be recycled.")
+        self._page_crashed = True
+
+    def _page_is_dead(self):
+        """
+        ~ Private method to check if the page can still be navigated. ~
+        """
+
+        return self._page_crashed or self.page.is_closed()
+
+    def _recycle(self, kind):
+        """
+        ~ Private method to replace the page, or the whole context,
+          so Chromium can release the memory it has accumulated. ~
+        """
+
+        if kind == "context":
+            self.context.close()
+            self._open_context()
+
+        else:
+            self.page.close()
+            self._open_page()
+
+        self.governor.record_recycle(kind)
 
     def can_scout_visit(self, url):
         """
@@ -99,25 +154,55 @@ class StateManager:
         if not self.page:
             self.start()
 
+        self.last_stats = {}
+
         if not self.can_scout_visit(url):
             logging.error(f"Access denied by robots.txt for {url}")
 
             return None
 
+        self.governor.begin_observation()
+
+        # ~ Recycle before navigating so the returned page stays usable. ~ #
+        recycle = self.governor.plan_recycle(page_dead=self._page_is_dead())
+
+        if recycle:
+            self._recycle(recycle)
+
         logging.info(f"Navigating to {url}")
 
-        self.page.goto(url, wait_until="networkidle")
+        # ~ Count first so failing pages still move the recycle limits. ~ #
+        self.governor.record_navigation()
+
+        try:
+            self.page.goto(url, wait_until="networkidle")
+
+        except PlaywrightError as e:
+            logging.error(f"Navigation to {url} failed: {e}")
+
+            # ~ Do not leave the next observation on a dead page. ~ #
+            if self._page_is_dead():
+                self._recycle(self.governor.plan_recycle(page_dead=True))
+
+            self.governor.sample_memory(self.page)
+            self.last_stats = self.governor.observation_stats()
+
+            return None
 
         self._human_scroll()
 
         dsf = self.page.evaluate("window.devicePixelRatio")
         self.page.screenshot(path=output_path)
 
+        self.governor.sample_memory(self.page)
+        self.last_stats = self.governor.observation_stats()
+
         return {
             "screenshot": output_path,
             "dsf": dsf,
             "viewport": self.page.viewport_size,
-            "page_handle": self.page
+            "page_handle": self.page,
+            "stats": self.last_stats
         }
 
     def _human_scroll(self):
@@ -137,6 +222,9 @@ class StateManager:
         ~ Cleanly closes all playwright resources. ~
         """
 
+        if self.context:
+            self.context.close()
+
         if self.browser:
             self.browser.close()
 
@@ -0,0 +1,519 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                            Company: SpudWorks
+                         Program Name: SpudScout
+       Description: An Agentic Web Scraper that uses Computer Vision.
+                            File: governor.py
+                            Date: 2026/10/19
+                        Version: 0.5.1-2026.10.19
+
+===============================================================================
+
+                     Copyright (C) 2026 SpudWorks Labs.
+
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+# ~ Import Standard Modules. ~ #
+import gc
+import os
+import time
+import logging
+from urllib.parse import urlparse
+
+# ~ Import Optional Third-Party Modules. ~ #
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# ~ Resource types that never change the visual landmarks we look for. ~ #
+DEFAULT_BLOCKED_TYPES = ("media", "font")
+
+# ~ Analytics and ad hosts, matched against the request host suffix. ~ #
+DEFAULT_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "scorecardresearch.com",
+    "newrelic.com",
+)
+
+# ~ Playwright resource types and their Chrome DevTools Protocol names. ~ #
+CDP_RESOURCE_TYPES = {
+    "document": "Document",
+    "stylesheet": "Stylesheet",
+    "image": "Image",
+    "media": "Media",
+    "font": "Font",
+    "script": "Script",
+    "texttrack": "TextTrack",
+    "xhr": "XHR",
+    "fetch": "Fetch",
+    "eventsource": "EventSource",
+    "websocket": "WebSocket",
+    "manifest": "Manifest",
+    "other": "Other",
+}
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class ResourceGovernor:
+    """
+    ~ Keeps a long-running browser session lean by blocking heavy
+      requests and deciding when the page or context must be recycled. ~
+
+    Functions:
+        __init__                       : Initialize the resource governor.
+        attach                         : Install routing on a context.
+        attach_page                    : Install in-browser blocking on a page.
+        fetch_patterns                 : Build the in-browser request filters.
+        begin_observation              : Reset the per-observation counters.
+        plan_recycle                   : Decide if the page/context is stale.
+        record_recycle                 : Reset counters after a recycle.
+        record_navigation              : Count a navigation on the page.
+        sample_memory                  : Measure Python and browser memory.
+        observation_stats              : Build the per-observation stats.
+    """
+
+    def __init__(self, page_recycle_after=25, context_recycle_after=100,
+                 browser_rss_watermark_mb=1536, python_rss_watermark_mb=1024,
+                 watermark_cooldown=5,
+                 blocked_resource_types=DEFAULT_BLOCKED_TYPES,
+                 blocked_hosts=DEFAULT_BLOCKED_HOSTS, route_requests=False):
+        """
+        ~ Initialize the Resource Governor. ~
+
+        Arguments:
+            - page_recycle_after (Int) : Navigations before a new page.
+            - context_recycle_after
+                                 (Int) : Navigations before a new context.
+            - browser_rss_watermark_mb
+                               (Float) : Browser memory that forces a new
+                                         context.
+            - python_rss_watermark_mb
+                               (Float) : Python memory that triggers a
+                                         garbage collection. It never
+                                         recycles the browser.
+            - watermark_cooldown (Int) : Navigations a context must serve
+                                         before the browser watermark
+                                         may recycle it again.
+            - blocked_resource_types
+                               (Tuple) : Playwright resource types to abort.
+            - blocked_hosts    (Tuple) : Host suffixes to abort.
+            - route_requests    (Bool) : Block through Playwright routing
+                                         instead of inside Chromium.
+
+        By default Chromium filters requests itself and only pauses the
+        blocked resource types and URLs that mention a blocked host; the
+        host is then checked exactly in Python. Everything else never
+        leaves the browser and the HTTP cache stays on. `route_requests`
+        sends every request through Python instead, and Playwright disables
+        the HTTP cache while routing, which slows long crawls down.
+
+        Attributes:
+            page_navigations     (Int) : Navigations on the current page.
+            context_navigations  (Int) : Navigations on the current context.
+            page_recycles        (Int) : Total page recycles.
+            context_recycles     (Int) : Total context recycles.
+            blocked_requests     (Int) : Requests aborted this observation.
+            last_sample         (Dict) : The most recent memory sample.
+
+        A limit or watermark of `None` or `0` disables that check.
+        """
+
+        self.page_recycle_after = page_recycle_after
+        self.context_recycle_after = context_recycle_after
+        self.browser_rss_watermark_mb = browser_rss_watermark_mb
+        self.python_rss_watermark_mb = python_rss_watermark_mb
+        self.watermark_cooldown = watermark_cooldown
+        self.blocked_resource_types = frozenset(blocked_resource_types or ())
+        self.blocked_hosts = tuple(blocked_hosts or ())
+        self.route_requests = route_requests
+
+        self.page_navigations = 0
+        self.context_navigations = 0
+        self.page_recycles = 0
+        self.context_recycles = 0
+        self.blocked_requests = 0
+        self.last_sample = {}
+
+        self._recycled = None
+        self._started_at = None
+        self._python_over = False
+        self._recycle_reason = None
+        self._verify_watermark = False
+
+    def attach(self, context):
+        """
+        ~ Route every request of the context through the blocker when
+          `route_requests` is set. Must be called for each new context. ~
+
+        Arguments:
+            - context (BrowserContext) : The Playwright context.
+        """
+
+        if self.route_requests and (self.blocked_resource_types or self.blocked_hosts):
+            context.route("**/*", self._route_request)
+
+    def attach_page(self, page):
+        """
+        ~ Let Chromium pause only the candidate requests of the page, so
+          the rest never go through Python. Must be called for each new
+          page. ~
+
+        Arguments:
+            - page              (Page) : The Playwright page.
+        """
+
+        patterns = self.fetch_patterns()
+
+        if self.route_requests or not patterns:
+            return
+
+        try:
+            cdp = page.context.new_cdp_session(page)
+            cdp.on("Fetch.requestPaused", lambda event: self._on_request_paused(cdp, event))
+            cdp.send("Fetch.enable", {"patterns": patterns})
+
+        except Exception as e:
+            logging.warning(f"Could not block requests in the browser: {e}")
+
+    def fetch_patterns(self):
+        """
+        ~ Build the `Fetch.enable` filters for the block lists. The host
+          filter is a coarse substring match; `_is_blocked` decides. ~
+
+        Returns:
+            - List                     : CDP request patterns.
+        """
+
+        patterns = []
+
+        for resource_type in sorted(self.blocked_resource_types):
+            cdp_type = CDP_RESOURCE_TYPES.get(resource_type)
+
+            if cdp_type:
+                patterns.append({"urlPattern": "*", "resourceType": cdp_type})
+
+        for host in self.blocked_hosts:
+            patterns.append({"urlPattern": f"*{host}*"})
+
+        return patterns
+
+    def _on_request_paused(self, cdp, event):
+        """
+        ~ Private method to fail or resume a request Chromium paused. ~
+        """
+
+        request_id = event["requestId"]
+        resource_type = event.get("resourceType", "Other").lower()
+
+        try:
+            if self._is_blocked(resource_type, event["request"]["url"]):
+                self.blocked_requests += 1
+                cdp.send("Fetch.failRequest", {
+                    "requestId": request_id,
+                    "errorReason": "BlockedByClient"
+                })
+
+                return
+
+            cdp.send("Fetch.continueRequest", {"requestId": request_id})
+
+        except Exception as e:
+            logging.debug(f"Could not resolve paused request: {e}")
+
+    def _route_request(self, route):
+        """
+        ~ Private method to abort heavy or tracking requests. ~
+        """
+
+        request = route.request
+
+        if self._is_blocked(request.resource_type, request.url):
+            self.blocked_requests += 1
+            route.abort()
+
+            return
+
+        route.continue_()
+
+    def _is_blocked(self, resource_type, url):
+        """
+        ~ Private method to check a request against the block lists. ~
+        """
+
+        if resource_type in self.blocked_resource_types:
+            return True
+
+        host = urlparse(url).hostname or ""
+
+        for blocked in self.blocked_hosts:
+            if host == blocked or host.endswith(f".{blocked}"):
+                return True
+
+        return False
+
+    def begin_observation(self):
+        """
+        ~ Reset the counters that are reported per observation. ~
+        """
+
+        self.blocked_requests = 0
+        self._recycled = None
+        self._recycle_reason = None
+        self._started_at = time.perf_counter()
+
+    def plan_recycle(self, page_dead=False):
+        """
+        ~ Decide if the session should be recycled before the next
+          navigation, based on navigation counts and the last sample. ~
+
+        The browser watermark only counts once the context has served
+        `watermark_cooldown` navigations, so a browser whose baseline sits
+        above the mark is not torn down on every navigation.
+
+        Arguments:
+            - page_dead         (Bool) : The page crashed or was closed.
+
+        Returns:
+            - String                   : "context", "page" or None.
+        """
+
+        browser_rss = self.last_sample.get("browser_rss_mb")
+
+        # ~ A crashed renderer is usually out of memory, start clean. ~ #
+        if page_dead:
+            self._recycle_reason = "crash"
+            return "context"
+
+        if self._over(self.context_navigations, self.context_recycle_after):
+            self._recycle_reason = "navigations"
+            return "context"
+
+        if (browser_rss is not None
+                and self._over(browser_rss, self.browser_rss_watermark_mb)
+                and self.context_navigations >= (self.watermark_cooldown or 0)):
+            logging.warning(f"Browser RSS at {browser_rss:.0f} MB, recycling context.")
+            self._recycle_reason = "watermark"
+            return "context"
+
+        if self._over(self.page_navigations, self.page_recycle_after):
+            self._recycle_reason = "navigations"
+            return "page"
+
+        self._recycle_reason = None
+
+        return None
+
+    @staticmethod
+    def _over(value, limit):
+        """
+        ~ Private method to compare a value against an optional limit. ~
+        """
+
+        return bool(limit) and value >= limit
+
+    def record_recycle(self, kind):
+        """
+        ~ Reset the navigation counters after a page or context recycle. ~
+
+        Arguments:
+            - kind            (String) : "page" or "context".
+        """
+
+        self.page_navigations = 0
+
+        if kind == "context":
+            self.context_navigations = 0
+            self.context_recycles += 1
+
+        else:
+            self.page_recycles += 1
+
+        self._recycled = kind
+        self._verify_watermark = self._recycle_reason == "watermark"
+        self.last_sample = {}
+
+        logging.info(f"Recycled the browser {kind}.")
+
+    def record_navigation(self):
+        """
+        ~ Count a navigation against the page and context limits. ~
+        """
+
+        self.page_navigations += 1
+        self.context_navigations += 1
+
+    def sample_memory(self, page=None):
+        """
+        ~ Measure the Python process, the browser process tree and the
+          JS heap of the page. Missing measurements are `None`. ~
+
+        Arguments:
+            - page              (Page) : The page to read the JS heap of.
+
+        Returns:
+            - Dict                     : The memory sample in MB.
+        """
+
+        self.last_sample = {
+            "python_rss_mb": self._python_rss_mb(),
+            "browser_rss_mb": self._browser_rss_mb(),
+            "js_heap_mb": self._js_heap_mb(page),
+        }
+
+        self._check_python_rss()
+        self._check_browser_rss()
+
+        return self.last_sample
+
+    def _check_browser_rss(self):
+        """
+        ~ Private method to warn when a watermark recycle did not bring
+          the browser back under the mark, meaning the shared browser,
+          GPU and driver processes alone are above it. ~
+        """
+
+        if not self._verify_watermark:
+            return
+
+        self._verify_watermark = False
+        browser_rss = self.last_sample.get("browser_rss_mb")
+
+        if browser_rss is not None and self._over(browser_rss, self.browser_rss_watermark_mb):
+            logging.warning(
+                f"Browser RSS still at {browser_rss:.0f} MB after recycling the context; "
+                f"the browser baseline is above the watermark, raise it or restart "
+                f"the browser."
+            )
+
+    def _check_python_rss(self):
+        """
+        ~ Private method to collect garbage once Python RSS is past its
+          watermark. Closing browser pages frees nothing in this process,
+          so the watermark is only reported, and warned about once. ~
+        """
+
+        python_rss = self.last_sample.get("python_rss_mb")
+        over = python_rss is not None and self._over(python_rss, self.python_rss_watermark_mb)
+
+        self.last_sample["python_over_watermark"] = over
+
+        if not over:
+            self._python_over = False
+
+            return
+
+        gc.collect()
+
+        if not self._python_over:
+            logging.warning(f"Python RSS at {python_rss:.0f} MB, past the watermark.")
+
+        self._python_over = True
+
+    @staticmethod
+    def _python_rss_mb():
+        """
+        ~ Private method to read the current RSS of this process.
+          Needs `psutil` or `/proc`; peak RSS is never used. ~
+        """
+
+        if psutil:
+            return psutil.Process().memory_info().rss / BYTES_PER_MB
+
+        try:
+            with open("/proc/self/statm", "r", encoding="utf-8") as f:
+                pages = int(f.read().split()[1])
+
+            return pages * os.sysconf("SC_PAGE_SIZE") / BYTES_PER_MB
+
+        except (OSError, ValueError, IndexError):
+            return None
+
+    @staticmethod
+    def _browser_rss_mb():
+        """
+        ~ Private method to sum the RSS of the Playwright driver and
+          every Chromium process it spawned. Needs `psutil`. ~
+        """
+
+        if not psutil:
+            return None
+
+        total = 0
+
+        for child in psutil.Process().children(recursive=True):
+            try:
+                total += child.memory_info().rss
+
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+        return total / BYTES_PER_MB
+
+    @staticmethod
+    def _js_heap_mb(page):
+        """
+        ~ Private method to read the used JS heap of the page. ~
+        """
+
+        if page is None:
+            return None
+
+        try:
+            heap = page.evaluate(
+                "performance.memory ? performance.memory.usedJSHeapSize : null"
+            )
+
+        except Exception as e:
+            logging.debug(f"Could not read the JS heap: {e}")
+
+            return None
+
+        return heap / BYTES_PER_MB if heap is not None else None
+
+    def observation_stats(self):
+        """
+        ~ Build the stats for the observation that just finished. ~
+
+        Returns:
+            - Dict                     : Counters, recycles and memory.
+        """
+
+        elapsed = None
+
+        if self._started_at is not None:
+            elapsed = time.perf_counter() - self._started_at
+
+        return {
+            "duration_s": elapsed,
+            "recycled": self._recycled,
+            "recycle_reason": self._recycle_reason if self._recycled else None,
+            "page_navigations": self.page_navigations,
+            "context_navigations": self.context_navigations,
+            "page_recycles": self.page_recycles,
+            "context_recycles": self.context_recycles,
+            "blocked_requests": self.blocked_requests,
+            **self.last_sample,
+        }
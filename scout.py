@@ -51,22 +51,28 @@ class Scout:
         export_state                   : Export the webpage state as JSON.
     """
 
-    def __init__(self):
+    def __init__(self, governor=None):
         """
         ~ Initialize the SpudScout and its attributes. ~
 
+        Arguments:
+            - governor
+                    (ResourceGovernor) : Optional browser resource limits.
+
         Attributes:
             - processor
                      (VisionProcessor) : The module to process an image.
             - classifier               
                    (ElementClassifier) : The module to classify each element.
             - current_state     (List) : A list of current elements.
+            - last_stats        (Dict) : Resource stats of the last observation.
         """
 
-        self.state_manager = StateManager()
+        self.state_manager = StateManager(governor=governor)
         self.processor = VisionProcessor()
         self.classifier = ElementClassifier()
         self.current_state = []
+        self.last_stats = {}
 
     def observe(self, url):
         """
@@ -79,6 +85,10 @@ class Scout:
         logging.info(f"Initiating observation on: {url}")
 
         state = self.state_manager.capture_view(url)
+        self.last_stats = self.state_manager.last_stats
+
+        if self.last_stats:
+            self._log_stats()
 
         if not state:
             logging.error("Failed to capture data, check url or the robots.txt")
@@ -98,6 +108,23 @@ class Scout:
 
         return self.current_state
 
+    def _log_stats(self):
+        """
+        ~ Private method to log the resource stats of the observation. ~
+        """
+
+        stats = self.last_stats
+        memory = ", ".join(
+            f"{key}={stats[key]:.1f}"
+            for key in ("python_rss_mb", "browser_rss_mb", "js_heap_mb")
+            if stats.get(key) is not None
+        )
+
+        logging.info(
+            f"Resources: {memory or 'memory unavailable'}, "
+            f"blocked={stats.get('blocked_requests', 0)}, "
+            f"recycled={stats.get('recycled')}"
+        )
 
     def export_state(self, filename="web_state.json"):
         """
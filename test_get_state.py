@@ -0,0 +1,201 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                            Company: SpudWorks
+                         Program Name: SpudScout
+       Description: An Agentic Web Scraper that uses Computer Vision.
+                          File: test_get_state.py
+                            Date: 2026/10/19
+                        Version: 0.5.1-2026.10.19
+
+===============================================================================
+
+                     Copyright (C) 2026 SpudWorks Labs.
+
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+# ~ Import Standard Modules. ~ #
+from types import SimpleNamespace
+
+# ~ Import Third-Party Modules. ~ #
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+# ~ Import Local Modules. ~ #
+import get_state
+from get_state import StateManager
+from governor import ResourceGovernor
+
+
+class FakeCDPSession:
+    """
+    ~ Accepts the CDP commands the governor sends. ~
+    """
+
+    def on(self, event, handler):
+        pass
+
+    def send(self, method, params=None):
+        pass
+
+
+class FakePage:
+    """
+    ~ A page that records its calls into a shared event log. ~
+    """
+
+    def __init__(self, context, name):
+        self.context = context
+        self.name = name
+        self.events = context.events
+        self.handlers = {}
+        self.closed = False
+        self.goto_error = None
+        self.crash_on_goto = False
+        self.viewport_size = {"width": 1280, "height": 720}
+        self.mouse = SimpleNamespace(wheel=lambda x, y: None)
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def goto(self, url, wait_until=None):
+        self.events.append(f"goto:{self.name}")
+
+        if self.crash_on_goto:
+            self.handlers["crash"](self)
+
+        if self.goto_error:
+            raise self.goto_error
+
+    def evaluate(self, script):
+        return 1.0 if "devicePixelRatio" in script else None
+
+    def screenshot(self, path):
+        self.events.append(f"screenshot:{self.name}")
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.events.append(f"close:{self.name}")
+        self.closed = True
+
+
+class FakeContext:
+    """
+    ~ A context that hands out numbered fake pages. ~
+    """
+
+    def __init__(self, browser, name):
+        self.browser = browser
+        self.name = name
+        self.events = browser.events
+
+    def route(self, pattern, handler):
+        pass
+
+    def new_cdp_session(self, page):
+        return FakeCDPSession()
+
+    def new_page(self):
+        self.browser.pages += 1
+        page = FakePage(self, f"page{self.browser.pages}")
+        self.events.append(f"new:{page.name}")
+
+        return page
+
+    def close(self):
+        self.events.append(f"close:{self.name}")
+
+
+class FakeBrowser:
+    """
+    ~ A browser that hands out numbered fake contexts. ~
+    """
+
+    def __init__(self):
+        self.events = []
+        self.contexts = 0
+        self.pages = 0
+
+    def new_context(self, **kwargs):
+        self.contexts += 1
+        name = f"context{self.contexts}"
+        self.events.append(f"new:{name}")
+
+        return FakeContext(self, name)
+
+    def close(self):
+        self.events.append("close:browser")
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """
+    ~ A StateManager running on the fake browser. ~
+    """
+
+    monkeypatch.setattr(get_state.time, "sleep", lambda seconds: None)
+
+    state_manager = StateManager(governor=ResourceGovernor(page_recycle_after=1))
+    monkeypatch.setattr(state_manager, "can_scout_visit", lambda url: True)
+
+    state_manager.browser = FakeBrowser()
+    state_manager._open_context()
+    state_manager.browser.events.clear()
+
+    return state_manager
+
+
+def test_capture_recycles_the_page_before_goto(manager):
+    first = manager.capture_view("https://example.com/", output_path="unused.png")
+    second = manager.capture_view("https://example.com/", output_path="unused.png")
+
+    assert manager.browser.events == [
+        "goto:page1", "screenshot:page1",
+        "close:page1", "new:page2", "goto:page2", "screenshot:page2",
+    ]
+    assert first["stats"]["recycled"] is None
+    assert second["stats"]["recycled"] == "page"
+    assert second["page_handle"].name == "page2"
+    assert not second["page_handle"].is_closed()
+
+
+def test_failed_goto_still_counts_and_reports(manager):
+    manager.page.goto_error = PlaywrightError("Timeout 30000ms exceeded.")
+
+    assert manager.capture_view("https://example.com/") is None
+    assert manager.governor.page_navigations == 1
+    assert manager.governor.context_navigations == 1
+    assert manager.last_stats["page_navigations"] == 1
+    assert manager.last_stats["recycled"] is None
+
+
+def test_crashed_page_is_recycled_right_away(manager):
+    manager.page.crash_on_goto = True
+    manager.page.goto_error = PlaywrightError("Navigation failed because page crashed!")
+
+    assert manager.capture_view("https://example.com/") is None
+    assert manager.browser.events[-2:] == ["new:context2", "new:page2"]
+    assert manager.last_stats["recycled"] == "context"
+    assert manager.last_stats["recycle_reason"] == "crash"
+    assert manager.page.name == "page2"
+
+
+def test_shutdown_closes_the_context_before_the_browser(manager):
+    manager.shutdown()
+
+    assert manager.browser.events == ["close:context1", "close:browser"]
@@ -0,0 +1,222 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+                            Company: SpudWorks
+                         Program Name: SpudScout
+       Description: An Agentic Web Scraper that uses Computer Vision.
+                          File: test_governor.py
+                            Date: 2026/10/19
+                        Version: 0.5.1-2026.10.19
+
+===============================================================================
+
+                     Copyright (C) 2026 SpudWorks Labs.
+
+        This program is free software: you can redistribute it and/or modify
+        it under the terms of the GNU Affero General Public License as published
+        by the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        This program is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU Affero General Public License for more details.
+
+        You should have received a copy of the GNU Affero General Public License
+        along with this program. If not, see <https://www.gnu.org/licenses/>
+
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+
+# ~ Import Standard Modules. ~ #
+import builtins
+
+# ~ Import Local Modules. ~ #
+import governor
+from governor import ResourceGovernor
+
+
+def navigate(gov, times):
+    """
+    ~ Record a number of navigations on the governor. ~
+    """
+
+    for _ in range(times):
+        gov.record_navigation()
+
+
+def test_is_blocked_matches_types_and_host_suffixes():
+    gov = ResourceGovernor()
+
+    assert gov._is_blocked("font", "https://example.com/a.woff2")
+    assert gov._is_blocked("script", "https://www.google-analytics.com/ga.js")
+    assert gov._is_blocked("script", "https://connect.facebook.net/sdk.js")
+    assert not gov._is_blocked("script", "https://example.com/app.js")
+    assert not gov._is_blocked("script", "https://notfacebook.net/sdk.js")
+
+
+def test_over_treats_none_and_zero_as_disabled():
+    assert ResourceGovernor._over(10, 10)
+    assert not ResourceGovernor._over(9, 10)
+    assert not ResourceGovernor._over(10**6, None)
+    assert not ResourceGovernor._over(10**6, 0)
+
+
+def test_plan_recycle_prefers_context_over_page():
+    gov = ResourceGovernor(page_recycle_after=2, context_recycle_after=4)
+
+    assert gov.plan_recycle() is None
+
+    navigate(gov, 2)
+    assert gov.plan_recycle() == "page"
+
+    navigate(gov, 2)
+    assert gov.plan_recycle() == "context"
+
+
+def test_dead_page_recycles_the_context_at_once():
+    gov = ResourceGovernor()
+
+    assert gov.plan_recycle(page_dead=True) == "context"
+
+    gov.begin_observation()
+    gov.plan_recycle(page_dead=True)
+    gov.record_recycle("context")
+
+    assert gov.observation_stats()["recycle_reason"] == "crash"
+
+
+def test_record_recycle_resets_counters():
+    gov = ResourceGovernor(page_recycle_after=2, context_recycle_after=10)
+    navigate(gov, 3)
+    gov.last_sample = {"browser_rss_mb": 100.0}
+
+    gov.record_recycle("page")
+
+    assert gov.page_navigations == 0
+    assert gov.context_navigations == 3
+    assert gov.page_recycles == 1
+    assert gov.last_sample == {}
+
+    gov.record_recycle("context")
+
+    assert gov.context_navigations == 0
+    assert gov.context_recycles == 1
+
+
+def test_python_watermark_never_recycles(monkeypatch):
+    gov = ResourceGovernor(python_rss_watermark_mb=1024)
+    collected = []
+
+    monkeypatch.setattr(gov, "_python_rss_mb", lambda: 2000.0)
+    monkeypatch.setattr(gov, "_browser_rss_mb", lambda: None)
+    monkeypatch.setattr(governor.gc, "collect", lambda: collected.append(1))
+
+    sample = gov.sample_memory()
+
+    assert sample["python_over_watermark"]
+    assert collected
+    assert gov.plan_recycle() is None
+
+
+def test_browser_watermark_waits_for_cooldown(monkeypatch):
+    gov = ResourceGovernor(browser_rss_watermark_mb=1000, watermark_cooldown=3)
+
+    monkeypatch.setattr(gov, "_python_rss_mb", lambda: None)
+    monkeypatch.setattr(gov, "_browser_rss_mb", lambda: 1500.0)
+
+    navigate(gov, 3)
+    gov.sample_memory()
+    assert gov.plan_recycle() == "context"
+
+    gov.record_recycle("context")
+    navigate(gov, 1)
+    gov.sample_memory()
+    assert gov.plan_recycle() is None
+
+    navigate(gov, 2)
+    assert gov.plan_recycle() == "context"
+
+
+def test_python_rss_is_none_without_a_current_source(monkeypatch):
+    real_open = builtins.open
+
+    def no_proc(path, *args, **kwargs):
+        if str(path).startswith("/proc"):
+            raise FileNotFoundError(path)
+
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(governor, "psutil", None)
+    monkeypatch.setattr(builtins, "open", no_proc)
+
+    assert ResourceGovernor._python_rss_mb() is None
+
+
+class FakeCDPSession:
+    """
+    ~ Records the CDP commands the governor sends. ~
+    """
+
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def send(self, method, params=None):
+        self.sent.append((method, params))
+
+
+def pause(gov, cdp, url, resource_type):
+    """
+    ~ Feed one paused request to the governor, return the CDP reply. ~
+    """
+
+    cdp.sent.clear()
+    gov._on_request_paused(cdp, {
+        "requestId": "1",
+        "resourceType": resource_type,
+        "request": {"url": url}
+    })
+
+    return cdp.sent[-1][0]
+
+
+def test_fetch_patterns_filter_by_type_and_host():
+    gov = ResourceGovernor(blocked_resource_types=("font", "media"),
+                           blocked_hosts=("doubleclick.net",))
+
+    assert gov.fetch_patterns() == [
+        {"urlPattern": "*", "resourceType": "Font"},
+        {"urlPattern": "*", "resourceType": "Media"},
+        {"urlPattern": "*doubleclick.net*"},
+    ]
+
+
+def test_paused_requests_block_only_exact_types_and_hosts():
+    gov = ResourceGovernor()
+    cdp = FakeCDPSession()
+
+    assert pause(gov, cdp, "https://cdn.example.com/clip.mp4", "Media") == "Fetch.failRequest"
+    assert pause(gov, cdp, "https://cdn.example.com/a.woff2", "Font") == "Fetch.failRequest"
+    assert pause(gov, cdp, "https://ad.doubleclick.net/x", "Script") == "Fetch.failRequest"
+    assert gov.blocked_requests == 3
+
+
+def test_paused_requests_keep_lookalike_urls():
+    gov = ResourceGovernor()
+    cdp = FakeCDPSession()
+    kept = [
+        ("https://www.webmd.com/", "Document"),
+        ("https://www.movies.com/", "Document"),
+        ("https://www.wavve.com/", "Document"),
+        ("https://cdn.example.com/img/remove.moving-box.png", "Image"),
+        ("https://example.com/login?next=https://ad.doubleclick.net/x", "Document"),
+        ("https://example.com/doubleclick.net/page", "Document"),
+    ]
+
+    for url, resource_type in kept:
+        assert pause(gov, cdp, url, resource_type) == "Fetch.continueRequest", url
+
+    assert gov.blocked_requests == 0